@@ -56,3 +56,5 @@ html_theme = "sphinx_rtd_theme"
 html_static_path = ["_static"]
 html_theme_options = {"navigation_depth": 4}
 autodoc_member_order = "groupwise"
+# the async wrapper's optional dependency isn't installed on the docs builder
+autodoc_mock_imports = ["serial_asyncio"]
@@ -2,3 +2,4 @@
 # make these available at package level
 from py_hplc.pump import NextGenPump  # noqa: F401
 from py_hplc.pump_base import NextGenPumpBase  # noqa: F401
+from py_hplc.pump_pool import ThreadedPumpPool  # noqa: F401
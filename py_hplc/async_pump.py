@@ -0,0 +1,237 @@
+"""Asyncio serial port wrapper for Next Generation pumps.
+This module mirrors the blocking interface for use under asyncio, so a rig
+with several pumps can poll them concurrently: N pumps awaited together cost
+roughly one round-trip instead of N.
+
+It depends on the optional pyserial-asyncio package, installable with the
+"async" extra::
+
+    pip install py-hplc[async]
+"""
+
+from __future__ import annotations
+
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import wait_for
+from logging import Logger, getLogger
+from typing import TYPE_CHECKING
+
+try:
+    from serial_asyncio import open_serial_connection
+except ImportError as err:  # pragma: no cover - import guard
+    raise ImportError(
+        "The async API requires the optional pyserial-asyncio package. "
+        "Install it with: pip install py-hplc[async]"
+    ) from err
+
+from serial.serialutil import EIGHTBITS, PARITY_NONE, STOPBITS_ONE
+
+from py_hplc.pump import (
+    CurrentConditions,
+    CurrentState,
+    Faults,
+    PumpInfo,
+    parse_current_conditions,
+    parse_current_state,
+    parse_faults,
+    parse_pump_info,
+)
+from py_hplc.pump_base import MESSAGE_END, _encode
+from py_hplc.pump_error import PumpError
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader, StreamWriter
+
+
+class AsyncNextGenPump:
+    """Asyncio analogue of `NextGenPump`.
+
+    Since opening the connection requires awaiting, instances start out
+    unconnected -- call `open()` before use::
+
+        pump = AsyncNextGenPump("/dev/ttyUSB0")
+        await pump.open()
+
+    Commands not wrapped here can be issued directly with `command`.
+    """
+
+    __slots__ = (
+        "device",
+        "logger",
+        "reader",
+        "writer",
+        "timeout",
+        "pressure_units",
+        "_pressure_parser",
+    )
+
+    def __init__(self, device: str, logger: Logger = None) -> None:
+        """Inititalizes an `AsyncNextGenPump` instance.
+
+        Args:
+            device (str): the port to open a connection at
+            logger (Logger, optional): a `logging.Logger` isntance. Defaults to None
+        """
+        self.device = device
+        if logger is None:  # append to the root logger
+            self.logger = getLogger(f"{getLogger().name}.{device}")
+        elif isinstance(logger, Logger):  # append to the passed logger
+            self.logger = getLogger(f"{logger.name}.{device}")
+        self.reader: StreamReader = None
+        self.writer: StreamWriter = None
+        self.timeout = 0.1  # 100 ms, as in the blocking wrapper
+        self.pressure_units: str = None
+        self._pressure_parser = float
+
+    async def open(self) -> None:
+        """Opens the serial connection associated with the pump.
+
+        Raises: SerialException: An exception describing what went wrong. In this case,
+        we failed to open the serial port.
+        """
+        self.reader, self.writer = await open_serial_connection(
+            url=self.device,
+            baudrate=9600,
+            bytesize=EIGHTBITS,
+            parity=PARITY_NONE,
+            stopbits=STOPBITS_ONE,
+        )
+        self.logger.info("Serial port connected")
+        # grab the pressure units so responses parse with the right type
+        # expect OK,<flow>,<UPL>,<LPL>,<p_units>,0,<R/S>,0/
+        response = await self.command("cs")
+        self.pressure_units = response.split(",")[4]
+        self._pressure_parser = int if self.pressure_units == "psi" else float
+
+    async def __aenter__(self) -> AsyncNextGenPump:
+        """Opens the connection: `async with AsyncNextGenPump(port) as pump`."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Closes the connection on exit."""
+        self.close()
+
+    async def command(self, command: str) -> str:
+        """Sends the passed string to the pump as bytes.
+
+        Raises:
+            PumpError: An exception describing what went wrong. In this case, the pump
+            reponded with an error code.
+
+        Returns:
+            str: the pump's decoded response string
+        """
+        response = await self.write(command)
+        if response.startswith("Er"):  # the error response is bare "Er/"
+            raise PumpError(
+                command=command,
+                response=response,
+                message=(
+                    f"The pump threw an error '{response}'"
+                    f"in response to a command: '{command}'"
+                ),
+                port=self.device,
+            )
+        return response
+
+    async def write(self, msg: str) -> str:
+        """Write a command to the pump and await its response.
+
+        Raises:
+            PumpError: An exception describing what went wrong. In this case, we
+            couldn't get a response.
+
+        Args:
+            msg (str): The message to be sent
+
+        Returns:
+            str: the pump's decoded response string
+        """
+        self.writer.write(_encode(msg))
+        await self.writer.drain()
+        self.logger.debug("Sent %s", msg)
+        if msg == "#":  # this won't give a response
+            return ""
+        try:
+            raw = await wait_for(self.reader.readuntil(MESSAGE_END), self.timeout)
+        except AsyncTimeoutError:
+            raw = b""
+        self.logger.debug("Got response: %s", raw)
+        if not raw:
+            raise PumpError(
+                command=msg,
+                response="",
+                message=(f"Couldn't get a message from the pump in response to {msg}"),
+                port=self.device,
+            )
+        return raw.decode()
+
+    # general pump commands ------------------------------------------------------------
+    async def run(self) -> str:
+        """Runs the pump."""
+        return await self.command("ru")
+
+    async def stop(self) -> str:
+        """Stops the pump."""
+        return await self.command("st")
+
+    async def keypad_enable(self) -> str:
+        """Enables the pump's keypad."""
+        return await self.command("ke")
+
+    async def keypad_disable(self) -> str:
+        """Disables the pump's keypad."""
+        return await self.command("kd")
+
+    async def clear_faults(self) -> str:
+        """Clears the pump's faults."""
+        return await self.command("cf")
+
+    # bundled info retrieval -- these will return dataclasses --------------------------
+    async def current_conditions(self) -> CurrentConditions:
+        """Returns a dataclass describing the current conditions of the pump.
+
+        Returns:
+            `CurrentConditions`: a `dataclass` with `pressure` and `flowrate` attributes
+        """
+        return parse_current_conditions(await self.command("cc"), self._pressure_parser)
+
+    async def current_state(self) -> CurrentState:
+        """Returns a dataclass describing the current state of the pump.
+
+        Returns:
+            `CurrentState`: dataclass with `flowrate`, `upper_pressure_limit`,
+            `lower_pressure_limit`, `pressure units`, `is_running`, and `response`
+            attributes
+        """
+        return parse_current_state(await self.command("cs"))
+
+    async def pump_info(self) -> PumpInfo:
+        """Gets a dataclass of information about the pump.
+
+        Returns:
+            `PumpInfo`: dataclass with `flowrate`, `is_running`,
+            `pressure_compensation`, `head`, `upper_limit`, `lower_limit`, `in_prime`,
+            `keypad_enabled`, `motor_stall_fault`, and `response` attributes
+        """
+        return parse_pump_info(await self.command("pi"))
+
+    async def read_faults(self) -> Faults:
+        """Returns a dataclass representing the pump's fault status.
+
+        Returns:
+            `Faults`: dataclass with `motor_stall_fault`, `upper_pressure_fault`,
+            `lower_pressure_fault`, and `reponse` attributes
+        """
+        return parse_faults(await self.command("rf"))
+
+    def close(self) -> None:
+        """Closes the serial connection associated with the pump."""
+        self.writer.close()
+        self.logger.info("Serial port closed")
+
+    @property
+    def is_open(self) -> bool:
+        """Returns a boolean representing if the internal connection is open."""
+        return self.writer is not None and not self.writer.is_closing()
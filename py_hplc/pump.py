@@ -10,19 +10,41 @@ the second argument.
 
 from __future__ import annotations
 
+import re
+from array import array
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from logging import Logger
+from time import monotonic
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from serial.serialutil import SerialBase
 
-from py_hplc.pump_base import NextGenPumpBase
+from py_hplc.pump_base import QUERY_COMMANDS, NextGenPumpBase
+from py_hplc.pump_error import PumpError
 
 if TYPE_CHECKING:
     from typing import Union
 
 
+# precompiled response patterns -- one pass over each response instead of a
+# full split per field
+# OK,<pressure>,<flow>/ -- pressure can read transiently negative near zero
+CC_PATTERN = re.compile(r"OK,(-?[\d.]+),([\d.]+)/")
+# OK,<flow>,<UPL>,<LPL>,<p_units>,0,<R/S>,0/
+CS_PATTERN = re.compile(r"OK,([\d.]+),([\d.]+),([\d.]+),(\w+),\d+,(\d),\d+/")
+# OK,<flow>,<R/S>,<p_comp>,<head>,0,1,0,0,<UPF>,<LPF>,<prime>,<keypad>,
+# 0,0,0,0,<stall>/
+PI_PATTERN = re.compile(
+    r"OK,([\d.]+),(\d),([\d.]+),(\w+),\d+,\d+,\d+,\d+,(\d),(\d),(\d),(\d),"
+    r"\d+,\d+,\d+,\d+,(\d)/"
+)
+# OK,<stall>,<UPF>,<LPF>/
+RF_PATTERN = re.compile(r"OK,(\d),(\d),(\d)/")
+
+
 # these are more or less useful than an int
 # LeakModes is currently unused
 class LeakModes(Enum):
@@ -68,8 +90,16 @@ class Solvents(Enum):
     WATER = 46
 
 
+# frozen lookups derived from the enums -- membership checks are O(1) hash
+# lookups and nothing gets rebuilt per call
+SOLVENT_COMPRESSIBILITY = MappingProxyType(
+    {solvent.name: solvent.value for solvent in Solvents}
+)
+LEAK_MODES = frozenset(mode.value for mode in LeakModes)
+
+
 # we return bundled data with these
-@dataclass
+@dataclass(frozen=True)
 class CurrentConditions:
     """A dataclass representing the current conditions of the pump.
 
@@ -86,7 +116,7 @@ class CurrentConditions:
     response: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class CurrentState:
     """A dataclass representing the current state of the pump.
 
@@ -109,7 +139,7 @@ class CurrentState:
     response: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class PumpInfo:
     """A dataclass representing information about the pump.
 
@@ -142,7 +172,33 @@ class PumpInfo:
     response: str
 
 
-@dataclass
+@dataclass(frozen=True)
+class Snapshot:
+    """A dataclass bundling the pump values most commonly read together.
+
+    Populated from one "pi" and one "cc" round-trip rather than a serial
+    transaction per property.
+
+    Attributes:
+        pressure (Union[float, int]): current pressure as a float (bar/MPa) or int (psi)
+        flowrate (float): current flowrate as a float
+        is_running (bool): whether or not the pump is currently running
+        head (str): the pump's head type
+        upper_pressure_fault (bool): whether the upper pressure limit has been reached
+        lower_pressure_fault (bool): whether the lower pressure limit has been reached
+        response (str): the pump's concatenated responses as a string
+    """
+
+    pressure: Union[float, int]
+    flowrate: float
+    is_running: bool
+    head: str
+    upper_pressure_fault: bool
+    lower_pressure_fault: bool
+    response: str
+
+
+@dataclass(frozen=True)
 class Faults:
     """A dataclass representing the pump's current fault state.
 
@@ -160,6 +216,90 @@ class Faults:
     response: str
 
 
+def _match(pattern: re.Pattern, command: str, response: str) -> re.Match:
+    """Matches a response against its expected shape.
+
+    Raises:
+        PumpError: An exception describing what went wrong. In this case, the
+        response doesn't have the shape the command's documentation promises.
+    """
+    match = pattern.match(response)
+    if match is None:
+        raise PumpError(
+            command=command,
+            response=response,
+            message=f"Couldn't parse a response to '{command}' from '{response}'",
+            port=None,
+        )
+    return match
+
+
+# parsing lives in free functions so the optional async wrapper in
+# py_hplc.async_pump can share it with the blocking class below.
+# a steady pump returns byte-identical responses poll after poll, so a tiny
+# LRU lets repeat polls skip parsing and construction entirely
+@lru_cache(maxsize=4)
+def parse_current_conditions(
+    response: str, pressure_parser: type = float
+) -> CurrentConditions:
+    """Parses a "cc" response into a `CurrentConditions` instance."""
+    # OK,<pressure>,<flow>/
+    match = _match(CC_PATTERN, "cc", response)
+    return CurrentConditions(
+        pressure=pressure_parser(match[1]),
+        flowrate=float(match[2]),
+        response=response,
+    )
+
+
+@lru_cache(maxsize=4)
+def parse_current_state(response: str) -> CurrentState:
+    """Parses a "cs" response into a `CurrentState` instance."""
+    # OK,<flow>,<UPL>,<LPL>,<p_units>,0,<R/S>,0/
+    match = _match(CS_PATTERN, "cs", response)
+    return CurrentState(
+        flowrate=float(match[1]),
+        upper_pressure_limit=float(match[2]),
+        lower_pressure_limit=float(match[3]),
+        pressure_units=match[4],
+        is_running=match[5] == "1",
+        response=response,
+    )
+
+
+@lru_cache(maxsize=4)
+def parse_pump_info(response: str) -> PumpInfo:
+    """Parses a "pi" response into a `PumpInfo` instance."""
+    # OK,<flow>,<R/S>,<p_comp>,<head>,0,1,0,0,<UPF>,<LPF>,<prime>,<keypad>,
+    # 0,0,0,0,<stall>/
+    match = _match(PI_PATTERN, "pi", response)
+    return PumpInfo(
+        flowrate=float(match[1]),
+        is_running=match[2] == "1",
+        pressure_compensation=float(match[3]),
+        head=match[4],
+        upper_pressure_fault=match[5] == "1",
+        lower_pressure_fault=match[6] == "1",
+        in_prime=match[7] == "1",
+        keypad_enabled=match[8] == "1",
+        motor_stall_fault=match[9] == "1",
+        response=response,
+    )
+
+
+@lru_cache(maxsize=4)
+def parse_faults(response: str) -> Faults:
+    """Parses an "rf" response into a `Faults` instance."""
+    # OK,<stall>,<UPF>,<LPF>/
+    match = _match(RF_PATTERN, "rf", response)
+    return Faults(
+        motor_stall_fault=match[1] == "1",
+        upper_pressure_fault=match[2] == "1",
+        lower_pressure_fault=match[3] == "1",
+        response=response,
+    )
+
+
 class NextGenPump(NextGenPumpBase):
     """Serial port wrapper for Next Generation pumps.
     Commands to the pumps are available as methods on this object.
@@ -169,6 +309,8 @@ class NextGenPump(NextGenPumpBase):
     a string represtation of the pump's response.
     """
 
+    __slots__ = ("snapshot_ttl", "_last_state", "_last_state_ts")
+
     def __init__(self, device: Union[SerialBase, str], logger: Logger = None) -> None:
         """Inititalizes a `NextGenPump` instance.
 
@@ -176,8 +318,25 @@ class NextGenPump(NextGenPumpBase):
             device (Union[str, Serial]): a `Serial` instance, or the port to open one at
             logger (Logger, optional): a `logging.Logger` isntance. Defaults to None
         """
+        # opt-in: when > 0, the state-backed properties reuse the last
+        # CurrentState for this many seconds instead of issuing a command
+        self.snapshot_ttl: float = 0
+        self._last_state: CurrentState = None
+        self._last_state_ts: float = 0.0
         super().__init__(device, logger)
 
+    def command(self, command: str) -> str:
+        """Sends the passed string to the pump as bytes.
+
+        See `NextGenPumpBase.command`. Side-effect commands additionally drop
+        the remembered `CurrentState` so the state-backed properties can't
+        serve pre-write values.
+        """
+        response = super().command(command)
+        if command not in QUERY_COMMANDS:
+            self._last_state = None
+        return response
+
     # general pump commands ------------------------------------------------------------
     # these don't return anything besides a string saying 'OK/' if they succeed
     # if they didn't succeed, an exception would have been raised
@@ -217,16 +376,7 @@ class NextGenPump(NextGenPumpBase):
         Returns:
             `CurrentConditions`: a `dataclass` with `pressure` and `flowrate` attributes
         """
-        response = self.command("cc")
-        msg = response.split(",")
-        # OK,<pressure>,<flow>/
-        if self.pressure_units == "psi":
-            pressure = int(msg[1])
-        else:
-            pressure = float(msg[1])
-        return CurrentConditions(
-            pressure=pressure, flowrate=float(msg[2][:-1]), response=response
-        )
+        return parse_current_conditions(self.command("cc"), self._pressure_parser)
 
     def current_state(self) -> CurrentState:
         """Returns a dataclass describing the current state of the pump.
@@ -236,17 +386,10 @@ class NextGenPump(NextGenPumpBase):
             `lower_pressure_limit`, `pressure units`, `is_running`, and `response`
             attributes
         """
-        response = self.command("cs")
-        # OK,<flow>,<UPL>,<LPL>,<p_units>,0,<R/S>,0/
-        msg = response.split(",")
-        return CurrentState(
-            flowrate=float(msg[1]),
-            upper_pressure_limit=float(msg[2]),
-            lower_pressure_limit=float(msg[3]),
-            pressure_units=msg[4],
-            is_running=bool(int(msg[6])),
-            response=response,
-        )
+        state = parse_current_state(self.command("cs"))
+        self._last_state = state
+        self._last_state_ts = monotonic()
+        return state
 
     def pump_info(self) -> PumpInfo:
         """Gets a dictionary of information about the pump.
@@ -256,21 +399,73 @@ class NextGenPump(NextGenPumpBase):
             `pressure_compensation`, `head`, `upper_limit`, `lower_limit`, `in_prime`,
             `keypad_enabled`, `motor_stall_fault`, and `response` attributes
         """
-        response = self.command("pi")
-        # OK,<flow>,<R/S>,<p_comp>,<head>,0,1,0,0,<UPF>,<LPF>,<prime>,<keypad>,
-        # 0,0,0,0,<stall>/
-        msg = response.split(",")
-        return PumpInfo(
-            flowrate=float(msg[1]),
-            is_running=bool(int(msg[2])),
-            pressure_compensation=float(msg[3]),
-            head=msg[4],
-            upper_pressure_fault=bool(int(msg[9])),
-            lower_pressure_fault=bool(int(msg[10])),
-            in_prime=bool(int(msg[11])),
-            keypad_enabled=bool(int(msg[12])),
-            motor_stall_fault=bool(int(msg[17][:-1])),
-            response=response,
+        return parse_pump_info(self.command("pi"))
+
+    # pre-1.0 releases called this pump_information -- keep the old name working
+    pump_information = pump_info
+
+    def _query_field(self, command: str, sep: str = ":") -> str:
+        """Issues a query and returns its single-field payload, less terminator."""
+        return self.command(command).rpartition(sep)[2][:-1]
+
+    def _fresh_state(self) -> Union[CurrentState, None]:
+        """Returns the last `CurrentState` if it is fresher than `snapshot_ttl`."""
+        if (
+            self.snapshot_ttl > 0
+            and self._last_state is not None
+            and monotonic() - self._last_state_ts < self.snapshot_ttl
+        ):
+            return self._last_state
+        return None
+
+    def sample_stream(self, n: int) -> tuple[array, array]:
+        """Collects n pressure/flowrate samples into columnar float arrays.
+
+        Meant for endurance logging: each sample costs 8 bytes across two
+        pre-allocated `array('f')` columns instead of a dataclass per read,
+        and the columns convert to numpy/pandas for free downstream.
+
+        Samples always hit the wire -- the short-TTL response cache is
+        bypassed so a tight loop can't see duplicate readings.
+
+        Args:
+            n (int): the number of samples to collect
+
+        Raises:
+            PumpError: An exception describing what went wrong. In this case,
+            the pump gave an unusable response.
+
+        Returns:
+            tuple[array, array]: the pressure and flowrate columns, respectively
+        """
+        pressures = array("f", bytes(4 * n))
+        flowrates = array("f", bytes(4 * n))
+        for i in range(n):
+            match = _match(CC_PATTERN, "cc", self.write("cc"))
+            pressures[i] = float(match[1])
+            flowrates[i] = float(match[2])
+        return pressures, flowrates
+
+    def snapshot(self) -> Snapshot:
+        """Polls the pump's most commonly read values in two round-trips.
+
+        Issues one "pi" and one "cc" command rather than a command per property,
+        cutting the wire cost of a typical control-loop tick.
+
+        Returns:
+            `Snapshot`: dataclass with `pressure`, `flowrate`, `is_running`, `head`,
+            `upper_pressure_fault`, and `lower_pressure_fault` attributes
+        """
+        info = self.pump_info()
+        conditions = self.current_conditions()
+        return Snapshot(
+            pressure=conditions.pressure,
+            flowrate=conditions.flowrate,
+            is_running=info.is_running,
+            head=info.head,
+            upper_pressure_fault=info.upper_pressure_fault,
+            lower_pressure_fault=info.lower_pressure_fault,
+            response=info.response + conditions.response,
         )
 
     def read_faults(self) -> Faults:
@@ -280,36 +475,27 @@ class NextGenPump(NextGenPumpBase):
             `Faults`: dataclass with `motor_stall_fault`, `upper_pressure_fault`,
             `lower_pressure_fault`, and `reponse` attributes
         """
-        response = self.command("rf")
-        msg = response.split(",")
-        # OK,<stall>,<UPF>,<LPF>/
-        return Faults(
-            motor_stall_fault=bool(int(msg[1])),
-            upper_pressure_fault=bool(int(msg[2])),
-            lower_pressure_fault=bool(int(msg[3][:-1])),
-            response=response,
-        )
+        return parse_faults(self.command("rf"))
 
     # general properties ---------------------------------------------------------------
     @property
     def is_running(self) -> None:
         """Returns a bool representing if the pump is running or not."""
-        return self.current_state().is_running
+        state = self._fresh_state()
+        return (state or self.current_state()).is_running
 
     @property
     def stroke_counter(self) -> int:
         """Gets the seal-life stroke counter as an int."""
-        response = self.command("gs")
         # OK,GS:<seal>/
-        return int(response.split(":")[1][:-1])
+        return int(self._query_field("gs"))
 
     # flowrate compensation
     @property
     def flowrate_compensation(self) -> float:
         """Returns the flowrate compensation as a float representing a percentage."""
-        response = self.command("uc")
         # OK,UC:<user_comp>/
-        return float(response.split(":")[1][:-1]) / 100
+        return float(self._query_field("uc")) / 100
 
     @flowrate_compensation.setter
     def flowrate_compensation(self, value: float) -> None:
@@ -320,15 +506,12 @@ class NextGenPump(NextGenPumpBase):
             value (float): The desired flowrate compensation,
             bounded between 0.85 and 1.15.
         """
-        value = round(value, 2)
-        if value < 0.85:
-            value = 0.85
-        elif value > 1.15:
-            value = 1.15
-        # pad leading 0s to 4 chars
-        # eg. 0.85 -> 850 ->  UC0850
+        # work in integer percent: one round, no float comparisons
+        # pad leading 0s to 4 chars, eg. 0.85 -> 85 -> UC0850
         # OK,UC:<user_comp>/
-        self.command("uc" + f"{round(value * 1000):04}")
+        value = round(value * 100)
+        value = 85 if value < 85 else 115 if value > 115 else value
+        self.command(f"uc{value * 10:04}")
 
     @property
     def flowrate(self) -> float:
@@ -339,6 +522,9 @@ class NextGenPump(NextGenPumpBase):
         Returns:
             float : the pump's flowrate in mililiters per minute
         """
+        state = self._fresh_state()
+        if state is not None:
+            return state.flowrate
         return self.current_conditions().flowrate
 
     @flowrate.setter
@@ -349,10 +535,9 @@ class NextGenPump(NextGenPumpBase):
         Args:
             flowrate (float): a float representing mililiters per minute
         """
-        # convert arg as float mL to base units
-        flowrate = flowrate / (10 ** 3)  # gets to L/min
-        flowrate = round(flowrate / (10 ** self.flowrate_factor))
-        self.command(f"fi{flowrate}")
+        # _flowrate_scale folds the mL -> L and resolution conversions into
+        # one integer factor fixed at identification (100 or 1000)
+        self.command(f"fi{round(flowrate * self._flowrate_scale)}")
 
     # individual properties for pressure enabled pumps ---------------------------------
     @property
@@ -363,10 +548,7 @@ class NextGenPump(NextGenPumpBase):
         """
         # beware using this on a tight loop https://stackoverflow.com/questions/6618002
         # OK,<pressure>/
-        if self.pressure_units == "psi":
-            return int(self.command("pr").split(",")[1][:-1])
-        else:
-            return float(self.command("pr").split(",")[1][:-1])
+        return self._pressure_parser(self._query_field("pr", sep=","))
 
     # upper and lower pressure limits
     @property
@@ -377,20 +559,16 @@ class NextGenPump(NextGenPumpBase):
         Values in bars can be precise to one digit after the decimal point.
         Values in MPa can be precise to two digits after the decimal point.
         """
-        response = self.command("up")
+        state = self._fresh_state()
+        if state is not None:
+            return state.upper_pressure_limit
         # OK,UP:<UPL>/
-        return float(response.split(":")[1][:-1])
+        return float(self._query_field("up"))
 
     @upper_pressure_limit.setter
     def upper_pressure_limit(self, limit: float) -> None:
         """Sets the upper pressure limit to a float in the pump's pressure units."""
-        if self.pressure_units == "psi":
-            limit = round(limit)
-        elif self.pressure_units == "bar":
-            limit = round(round(limit, 1) * 10)  # 19.99 -> 20.0 -> 200
-        elif self.pressure_units == "MPa":
-            limit = round(round(limit, 2) * 100)  # 1.999 -> 2.00 -> 200
-        self.command(f"up{limit}")
+        self.command(f"up{self._scale_pressure(limit)}")
 
     @property
     def lower_pressure_limit(self) -> float:
@@ -400,20 +578,21 @@ class NextGenPump(NextGenPumpBase):
         Values in bars can be precise to one digit after the decimal point.
         Values in MPa can be precise to two digits after the decimal point.
         """
-        response = self.command("lp")
+        state = self._fresh_state()
+        if state is not None:
+            return state.lower_pressure_limit
         # OK,LP:<LPL>/
-        return float(response.split(":")[1][:-1])
+        return float(self._query_field("lp"))
 
     @lower_pressure_limit.setter
     def lower_pressure_limit(self, limit: float) -> None:
         """Sets the pump's lower pressure limit."""
-        if self.pressure_units == "psi":
-            limit = round(limit)
-        elif self.pressure_units == "bar":
-            limit = round(round(limit, 1) * 10)  # 19.99 -> 20.0 -> 200
-        elif self.pressure_units == "MPa":
-            limit = round(round(limit, 2) * 100)  # 1.999 -> 2.00 -> 200
-        self.command(f"lp{limit}")
+        self.command(f"lp{self._scale_pressure(limit)}")
+
+    def _scale_pressure(self, limit: float) -> int:
+        """Converts a limit in the pump's pressure units to the int the pump takes."""
+        digits, scale = self._pressure_scale
+        return round(round(limit, digits) * scale)
 
     # properties for pumps with a leak sensor ------------------------------------------
     @property
@@ -424,9 +603,8 @@ class NextGenPump(NextGenPumpBase):
         Returns:
             bool: whether or not a leak is detected
         """
-        response = self.command("ls")
         # OK,LS:<leak>/
-        return bool(int(response.split(":")[1][:-1]))
+        return self._query_field("ls") == "1"
 
     def set_leak_mode(self, mode: int) -> int:
         """Sets the pump's current leak mode as an int.
@@ -434,7 +612,7 @@ class NextGenPump(NextGenPumpBase):
         0 if disabled. 1 if detected leak will fault. 2 if it will not fault.
         """
         # there seems to not be a way to query the current value without setting it
-        if mode not in {mode.value for mode in LeakModes}:
+        if mode not in LEAK_MODES:
             raise ValueError(
                 f"Invalid leak mode: {mode}. Choose from 0 (disabled), 1 (will fault), "
                 "or 2 (won't fault)."
@@ -451,12 +629,12 @@ class NextGenPump(NextGenPumpBase):
         See SOLVENT_COMPRESSIBILITY to get the solvent name.
         """
         # OK,<solvent>/
-        return int(self.command("rs").split(",")[1][:-1])
+        return int(self._query_field("rs", sep=","))
 
     @solvent.setter
     def solvent(self, value: Union[str, int]) -> None:
         """Gets/sets the solvent compressibility value as an int in 10 ** -6 per bar."""
         # if we got a solvent name string, convert it to an int
-        if value in Solvents.__members__:
-            value = Solvents[value.upper()].value
+        if isinstance(value, str):
+            value = SOLVENT_COMPRESSIBILITY.get(value.upper(), value)
         self.command(f"ss{value}")  # OK/
@@ -6,8 +6,14 @@ an interface for communicating with the pumps.
 
 from __future__ import annotations
 
-from logging import Logger, getLogger
-from time import sleep
+import json
+import re
+from functools import lru_cache
+from hashlib import blake2b
+from logging import DEBUG, Logger, getLogger
+from os import environ
+from pathlib import Path
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Union
 
 from serial import SerialException, serial_for_url
@@ -18,10 +24,79 @@ from py_hplc.pump_error import PumpError
 if TYPE_CHECKING:
     from logging import Logger
 
+# read-only queries whose responses may be briefly cached to coalesce polling;
+# commands with side effects (eg. "ru", "st", or any setter) never are
+QUERY_COMMANDS = frozenset(
+    (
+        "cc",
+        "cs",
+        "pi",
+        "rf",
+        "pr",
+        "gs",
+        "uc",
+        "up",
+        "lp",
+        "ls",
+        "rs",
+        "id",
+        "pu",
+        "mp",
+        "mf",
+    )
+)
+
+# maps pressure units to (rounding digits, integer scale) for the limit setters
+# eg. 19.99 bar -> 20.0 -> 200
+PRESSURE_SCALES = {"psi": (0, 1), "bar": (1, 10), "MPa": (2, 100)}
+
+# identify() response shapes, compiled once at import
+# OK,<flow>,<UPL>,<LPL>,<p_units>,0,<R/S>,0/ -- the flow's decimals give the
+# volumetric resolution
+CS_FIELDS = re.compile(r"OK,\d+\.(\d+),[\d.]+,[\d.]+,(\w+),")
+# OK,<flow>,<R/S>,<p_comp>,<head>,...
+PI_HEAD = re.compile(r"OK,(?:[^,]+,){3}([^,]+),")
+
+COMMAND_END = b"\r"  # terminates commands sent to the pump
+MESSAGE_END = b"/"  # terminates responses from the pump
+
+
+def _cache_dir() -> Path:
+    """Returns the on-disk cache directory, respecting XDG_CACHE_HOME."""
+    return Path(environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "py_hplc"
+
+
+@lru_cache(maxsize=128)
+def _encode(msg: str) -> bytes:
+    """Encodes a command with its terminator, caching the result.
+
+    The command vocabulary is tiny, so each distinct message is only ever
+    encoded once per process.
+    """
+    return msg.encode() + COMMAND_END
+
 
 class NextGenPumpBase:
     """Serial port wrapper for MX-class Teledyne pumps."""
 
+    # a flat slot layout: attribute reads skip the per-instance dict, which
+    # matters a little on the command hot path and compounds per pump
+    __slots__ = (
+        "serial",
+        "logger",
+        "max_flowrate",
+        "max_pressure",
+        "version",
+        "pressure_units",
+        "head",
+        "flowrate_factor",
+        "cache_ttl",
+        "_cache",
+        "_pressure_parser",
+        "_pressure_scale",
+        "_flowrate_scale",
+    )
+
     def __init__(self, device: Union[SerialBase, str], logger: Logger = None) -> None:
         if isinstance(device, str):
             # fetch a platform-appropriate serial interface
@@ -54,6 +129,15 @@ class NextGenPumpBase:
         # other -- for converting user args on the fly
         # 0.00 mL vs 0.000 mL; could rep. as 2 || 3?
         self.flowrate_factor: int = None  # used as 10 ** flowrate_factor
+        self._flowrate_scale: int = None  # mL/min -> the int the FI command takes
+        # pressures are ints in psi, floats otherwise -- the parser and limit
+        # scale are fixed once at identification instead of a lookup per call
+        self._pressure_parser = float
+        self._pressure_scale: tuple = (0, 1)
+        # successive reads of the same query within this window share one response.
+        # set to 0 to disable caching for hard-real-time callers
+        self.cache_ttl: float = 0.05  # seconds
+        self._cache: dict[str, tuple[float, str]] = {}
 
         # other configuration logic here
         if not self.is_open:
@@ -73,61 +157,161 @@ class NextGenPumpBase:
             self.logger.critical("Could not open a serial connection")
             self.logger.exception(err)
             raise
+        try:
+            # drops the USB-serial latency timer from its 16 ms default to
+            # 1 ms, which shrinks every round-trip -- responses are only a
+            # few bytes, exactly the regime where USB frame batching hurts
+            self.serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError) as err:
+            # not all ports/platforms support this; it's purely best-effort
+            self.logger.debug("Couldn't enable low-latency mode: %s", err)
 
     def identify(self) -> None:
-        """Gets persistent pump properties."""
-        # general properties -----------------------------------------------------------
-        # pump head
-        response = self.command("pi")
-        if "OK," in response:
-            self.head = response.split(",")[4]
+        """Gets persistent pump properties.
 
-        # max flowrate
-        response = self.command("mf")
-        if "OK,MF:" in response:  # expect OK,MF:<max_flow>/
-            self.max_flowrate = float(response.split(":")[1][:-1])
+        Round-trips are coalesced where one response carries several fields:
+        "cs" provides both the volumetric resolution and the pressure units,
+        so a separate "pu" command is never issued.
+
+        The properties gathered here are device-invariant between power
+        cycles, so they are also cached on disk keyed by the pump's "id"
+        response. Reopening the same pump then costs a single round-trip
+        instead of five.
+        """
+        # version -- expect OK,<ID> Version <ver>/
+        id_response = self.command("id")
+        if id_response.startswith("OK,"):
+            self.version = id_response[3:-1].strip()  # drop "OK," and "/"
+
+        if self._load_identity(id_response):
+            return
 
-        # volumetric resolution - used for setting flowrates later
+        # general properties -----------------------------------------------------------
+        # volumetric resolution and pressure units - used for conversions later
         # expect OK,<flow>,<UPL>,<LPL>,<p_units>,0,<R/S>,0/
-        response = self.command("cs")
-        precision = len(response.split(",")[1].split(".")[1])
-        if precision == 2:  # eg. "5.00"
+        match = CS_FIELDS.match(self.command("cs"))
+        if len(match[1]) == 2:  # eg. "5.00"
             self.flowrate_factor = -5  # FI takes microliters/min * 10 as ints
         else:  # eg. "5.000"
             self.flowrate_factor = -6  # FI takes microliters/min as ints
+        self.pressure_units = match[2]
+        self._derive_conversions()
+
+        # pump head
+        match = PI_HEAD.match(self.command("pi"))
+        if match:
+            self.head = match[1]
 
-        # version
-        response = self.command("id")
-        if "OK," in response:  # expect OK,<ID> Version <ver>/
-            self.version = response.split(",")[1][:-1].strip()
+        # max flowrate
+        response = self.command("mf")
+        if response.startswith("OK,MF:"):  # expect OK,MF:<max_flow>/
+            self.max_flowrate = float(response[6:-1])
 
         # for pumps that have a pressure sensor ----------------------------------------
-        # pressure units
-        response = self.command("pu")
-        if "OK," in response:  # expect "OK,<p_units>/"
-            self.pressure_units = response.split(",")[1][:-1]
-
         # max pressure
         response = self.command("mp")
-        if "OK,MP:" in response:  # expect "OK,MP:<max_pressure>/"
-            self.max_pressure = float(response.split(":")[1][:-1])
+        if response.startswith("OK,MP:"):  # expect "OK,MP:<max_pressure>/"
+            self.max_pressure = float(response[6:-1])
+
+        self._dump_identity(id_response)
+
+    def _derive_conversions(self) -> None:
+        """Fixes the unit-conversion helpers once the pump's identity is known."""
+        self._pressure_parser = int if self.pressure_units == "psi" else float
+        self._pressure_scale = PRESSURE_SCALES.get(self.pressure_units, (0, 1))
+        # fold the mL -> L and resolution conversions into one integer factor
+        self._flowrate_scale = 10 ** (-3 - self.flowrate_factor)
+
+    def _identity_path(self, id_response: str) -> Path:
+        """Returns the cache file path for a pump's "id" response."""
+        digest = blake2b(id_response.encode(), digest_size=8).hexdigest()
+        return _cache_dir() / f"{digest}.json"
+
+    def _load_identity(self, id_response: str) -> bool:
+        """Tries to populate the identity attributes from the on-disk cache.
+
+        Returns:
+            bool: whether the cache held a usable entry
+        """
+        try:
+            data = json.loads(self._identity_path(id_response).read_text())
+            self.max_flowrate = data["max_flowrate"]
+            self.max_pressure = data["max_pressure"]
+            self.pressure_units = data["pressure_units"]
+            self.head = data["head"]
+            self.flowrate_factor = data["flowrate_factor"]
+        except (OSError, ValueError, KeyError):  # missing or unusable entry
+            return False
+        self._derive_conversions()
+        self.logger.debug("Loaded pump identity from cache")
+        return True
+
+    def _dump_identity(self, id_response: str) -> None:
+        """Writes the identity attributes to the on-disk cache."""
+        path = self._identity_path(id_response)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(
+                    {
+                        "max_flowrate": self.max_flowrate,
+                        "max_pressure": self.max_pressure,
+                        "pressure_units": self.pressure_units,
+                        "head": self.head,
+                        "flowrate_factor": self.flowrate_factor,
+                    }
+                )
+            )
+        except OSError as err:  # a read-only home dir shouldn't break the pump
+            self.logger.debug("Couldn't cache pump identity: %s", err)
 
     def command(self, command: str) -> str:
         """Sends the passed string to the pump as bytes.
 
+        Responses to read-only queries are cached for `cache_ttl` seconds, so
+        several properties read within one control-loop tick coalesce into a
+        single wire transaction. Commands with side effects always hit the wire.
+
         Args:
             command (str): The message to be sent as bytes
 
         Raises:
             PumpError: An exception describing what went wrong. In this case, the pump
-            reponded with an error code.
+            reponded with an error code, or didn't respond at all.
 
         Returns:
-            dict[str, Any]: A dictionary containing at least a "response" key
-            with the pump's response
+            str: the pump's decoded response string
         """
-        response = self.write(command)
-        if "Er/" in response:
+        cacheable = self.cache_ttl > 0 and command in QUERY_COMMANDS
+        if cacheable:
+            cached = self._cache.get(command)
+            if cached is not None and monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+        # transmission policy lives here: up to 3 attempts per pump docs, with
+        # a cleanup-and-settle between them. write() itself is one exchange
+        for tries in range(1, 4):
+            response = self.write(command)
+            if response.startswith("OK") or command == "#":
+                break
+            self.logger.debug("No OK from %s (attempt %s/3)", command, tries)
+            # a failed exchange may leave stale bytes behind; writing b"#"
+            # would clear the pump's command buffer too, but shouldn't be
+            # relied upon
+            self.serial.reset_input_buffer()
+            self.serial.reset_output_buffer()
+            sleep(0.1)  # recommended delay between successive transmissions
+
+        # let's throw an error if we couldn't get a response
+        if response == "" and command != "#":
+            raise PumpError(
+                command=command,
+                response="",
+                message=(
+                    f"Couldn't get a message from the pump in response to {command}"
+                ),
+                port=self.serial.name,
+            )
+        if response.startswith("Er"):  # the error response is bare "Er/"
             raise PumpError(
                 command=command,
                 response=response,
@@ -138,78 +322,59 @@ class NextGenPumpBase:
                 port=self.serial.name,
             )
 
+        if cacheable:
+            self._cache[command] = (monotonic(), response)
+        elif self._cache:
+            # a side-effect command may change what the queries report, so a
+            # read right after a write must not see a pre-write response
+            self._cache.clear()
         return response  # we parse this later
 
-    def write(self, msg: str, delay: float = 0.015) -> str:
-        """Write a command to the pump.
-
-        A response will be returned after at least (2 * delay) seconds.
-        Delay defaults to 0.015 s per pump documentation.
-        If we fail to get a "OK" response, we will wait 0.1 s before attempting again,
-        up to 3 attempts.
+    def write(self, msg: str) -> str:
+        """Write a single command to the pump and read its response.
 
-        Returns the pump's response string.
-
-        Raises:
-            PumpError: An exception describing what went wrong. In this case, we
-            couldn't get a response.
+        This is exactly one exchange: one write, then one read blocking until
+        the pump's message terminator arrives, bounded by the port's timeout.
+        Retries and buffer cleanup belong to `command`.
 
         Args:
             msg (str): The message to be sent
-            delay (float, optional): A float in seconds. Defaults to 0.015.
 
         Returns:
-            str: the pump's decoded response string
+            str: the pump's decoded response string, empty if none arrived
         """
-        response = ""
-        tries = 1
-        cmd = "".join((msg, "\r")).encode()  # defaults to utf-8
-        while tries <= 3:  # pump docs recommend 3 attempts
-            # this would clear the pump's command buffer, but shouldn't be relied upon
-            # self.serial.write(b"#")
+        if self.serial.in_waiting:
+            # a late reply from an earlier timed-out exchange would otherwise
+            # be read as the response to this command
             self.serial.reset_input_buffer()
-            self.serial.reset_output_buffer()
-            sleep(delay)  # let the hardware buffers clear (could defer here if async)
-            self.serial.write(cmd)
-            self.serial.flush()  # sleeps on a tight loop until everything is written
-            self.logger.debug("Sent %s (attempt %s/3)", msg, tries)
-
-            if msg == "#":  # this won't give a response
-                break
-            sleep(delay)  # let the pump respond
-            response = self.read()  # returns an already-decoded string
-            if "OK" in response:  # no need to retry
-                break
-            tries += 1
-            sleep(0.1)  # recommended delay between successive transmissions
-
-        # let's throw an error if we couldn't get a response
-        if response == "" and msg != "#":
-            raise PumpError(
-                command=msg,
-                response=response,
-                message=(f"Couldn't get a message from the pump in response to {msg}"),
-                port=self.serial.name,
-            )
-
-        return response
-
-    def read(self) -> str:
+        # commands are a handful of bytes, so they fit the OS transmit buffer in
+        # one write -- flush() would just spin until the UART drains.
+        # encoding is cached, happening once per distinct command
+        self.serial.write(_encode(msg))
+        if self.logger.isEnabledFor(DEBUG):  # skip lazy-formatting costs when off
+            self.logger.debug("Sent %s", msg)
+
+        if msg == "#":  # this won't give a response
+            return ""
+        # read_until returns as soon as the terminator arrives -- no need to
+        # sleep for a response that may already be in the buffer
+        return self.read().decode()
+
+    def read(self) -> bytes:
         """Reads a single message from the pump.
 
+        Decoding is deferred to `write` so retries never pay for it and the
+        happy path decodes exactly once.
+
         Returns:
-            str: The pump's response, or an empty string if no response is given.
+            bytes: The pump's raw response, or empty bytes if no response is given.
         """
-        response = b""
-        tries = 1
-        while tries <= 3:
-            response = self.serial.read_until(b"/")  # we don't know the size a priori
-            self.logger.debug("Got response: %s (attempt %s/3)", response, tries)
-            if b"/" in response:  # b"/" is the pump's EOL flag
-                break
-            tries += 1
-
-        return response.decode()
+        # read_until blocks until MESSAGE_END (the pump's EOL flag) arrives, or until
+        # the port's timeout lapses -- no need to poll in a retry loop here
+        response = self.serial.read_until(MESSAGE_END)  # we don't know the size
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug("Got response: %s", response)
+        return response
 
     def close(self) -> None:
         """Closes the serial port associated with the pump."""
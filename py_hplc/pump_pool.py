@@ -0,0 +1,82 @@
+"""A thread-backed pool for driving several pumps without blocking the caller.
+GUIs and control loops often talk to more than one pump at once, and every
+blocking command costs a full serial round-trip. The pool owns one daemon
+worker per pump, so commands to different pumps overlap on the wire and the
+submitting thread never blocks. Results come back as futures, which asyncio
+code can await via `asyncio.wrap_future`.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from py_hplc.pump_base import NextGenPumpBase
+
+
+class ThreadedPumpPool:
+    """Funnels pump commands through one daemon worker thread per pump.
+
+    Commands submitted for the same pump execute in order on its worker;
+    commands for different pumps overlap. Serial access stays single-threaded
+    per port, so no locking is needed around the pumps themselves.
+    """
+
+    def __init__(self, *pumps: NextGenPumpBase) -> None:
+        """Initializes a `ThreadedPumpPool` and starts its workers.
+
+        Args:
+            *pumps (NextGenPumpBase): the already-open pumps to be driven
+        """
+        self._queues: dict = {}
+        self._threads: list = []
+        for pump in pumps:
+            queue: Queue = Queue()
+            thread = Thread(target=self._work, args=(pump, queue), daemon=True)
+            self._queues[pump] = queue
+            self._threads.append(thread)
+            thread.start()
+
+    @staticmethod
+    def _work(pump: NextGenPumpBase, queue: Queue) -> None:
+        """Executes queued commands for one pump until told to stop."""
+        while True:
+            item = queue.get()
+            if item is None:  # close() sentinel
+                return
+            command, future = item
+            if not future.set_running_or_notify_cancel():
+                continue  # cancelled before it hit the wire
+            try:
+                future.set_result(pump.command(command))
+            except Exception as err:  # surfaced to the caller via the future
+                future.set_exception(err)
+
+    def submit(self, pump: NextGenPumpBase, command: str) -> Future:
+        """Queues a command for a pump without blocking.
+
+        Args:
+            pump (NextGenPumpBase): one of the pumps handed to the pool
+            command (str): the message to be sent, as for `NextGenPumpBase.command`
+
+        Raises:
+            KeyError: An exception describing what went wrong. In this case, the
+            pump isn't managed by this pool.
+
+        Returns:
+            Future: resolves to the pump's response string, or to the
+            `PumpError` the command raised
+        """
+        future: Future = Future()
+        self._queues[pump].put((command, future))
+        return future
+
+    def close(self) -> None:
+        """Stops the workers once their queued commands have finished."""
+        for queue in self._queues.values():
+            queue.put(None)
+        for thread in self._threads:
+            thread.join()
@@ -1,7 +1,9 @@
 """This module tests the functionality of the NextGenPump class."""
 
+import argparse
 import sys
 import unittest
+from os import environ
 from time import sleep
 
 from serial.serialutil import SerialException
@@ -18,18 +20,24 @@ from py_hplc.pump_error import PumpError
 
 
 class TestPump(unittest.TestCase):
-    SERIAL_PORT = "COM4"  # this is machine-specific
+    # machine-specific: set PYHPLC_SERIAL_PORT, or pass a port on the CLI
+    SERIAL_PORT = environ.get("PYHPLC_SERIAL_PORT", "")
     PUMP = None
 
-    # setUp and tearDown will get run between each test method
-    def setUp(self) -> None:
+    # the port-open + identify handshake is paid once and shared by every test
+    @classmethod
+    def setUpClass(cls) -> None:
+        if not cls.SERIAL_PORT:
+            raise unittest.SkipTest("set PYHPLC_SERIAL_PORT to run hardware tests")
         try:
-            TestPump.PUMP = NextGenPump(self.SERIAL_PORT)
-        except SerialException:
-            self.fail(f"No such port {self.SERIAL_PORT}")
+            cls.PUMP = NextGenPump(cls.SERIAL_PORT)
+        except SerialException as err:
+            raise unittest.SkipTest(f"No such port {cls.SERIAL_PORT}") from err
 
-    def tearDown(self) -> None:
-        self.PUMP.close()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        if cls.PUMP is not None and cls.PUMP.is_open:
+            cls.PUMP.close()
 
     def test_run_stop(self) -> None:
         self.assertIn("OK", self.PUMP.run())
@@ -154,9 +162,53 @@ class TestPump(unittest.TestCase):
         self.assertEqual(current, self.PUMP.solvent)
 
 
+class _StubPump(NextGenPump):
+    """A disconnected pump that records commands, for hardware-free math tests."""
+
+    __slots__ = ("sent",)
+
+    def __init__(self, flowrate_factor: int) -> None:
+        self.sent = []
+        self._last_state = None
+        self.pressure_units = "psi"
+        self.flowrate_factor = flowrate_factor
+        self._derive_conversions()
+
+    def command(self, command: str) -> str:
+        self.sent.append(command)
+        return "OK/"
+
+
+class TestFlowrateConversion(unittest.TestCase):
+    """Checks the flowrate setter's precomputed conversion without hardware."""
+
+    def test_flowrate_scale(self) -> None:
+        # factor -5 (0.00 mL pumps) scales mL/min by 100; factor -6 by 1000
+        for factor, scale in ((-5, 100), (-6, 1000)):
+            with self.subTest(flowrate_factor=factor):
+                pump = _StubPump(factor)
+                self.assertEqual(pump._flowrate_scale, scale)
+                pump.flowrate = 2.5
+                self.assertEqual(pump.sent[-1], f"fi{round(2.5 * scale)}")
+
+    def test_matches_documented_conversion(self) -> None:
+        # equivalence with the original two-step mL -> L -> FI-units arithmetic
+        for factor in (-5, -6):
+            pump = _StubPump(factor)
+            for flowrate in (0.0, 0.25, 5.0, 9.999):
+                with self.subTest(flowrate_factor=factor, flowrate=flowrate):
+                    pump.flowrate = flowrate
+                    expected = round((flowrate / 10 ** 3) / (10 ** factor))
+                    self.assertEqual(pump.sent[-1], f"fi{expected}")
+
+
 if __name__ == "__main__":
     # pass in the serial port you want to test on
-    # python -m unittest <FILE> <PORT>
-    if len(sys.argv) > 1:
-        TestPump.SERIAL_PORT = sys.argv.pop()
+    # python <FILE> <PORT>
+    parser = argparse.ArgumentParser()
+    parser.add_argument("port", nargs="?", default=TestPump.SERIAL_PORT)
+    args, remaining = parser.parse_known_args()
+    TestPump.SERIAL_PORT = args.port
+    # hand unittest a clean argv so its own flags still parse
+    sys.argv[:] = [sys.argv[0]] + remaining
     unittest.main()